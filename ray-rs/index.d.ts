@@ -979,6 +979,7 @@ export interface DbStats {
   snapshotNodes: number
   snapshotEdges: number
   snapshotMaxNodeId: number
+  nextNodeId: number
   deltaNodesCreated: number
   deltaNodesDeleted: number
   deltaEdgesAdded: number
@@ -152,6 +152,7 @@ from kitedb.builders import (
 from kitedb.traversal import (
     EdgeResult,
     EdgeTraversalResult,
+    PropFilter,
     RawEdge,
     TraverseOptions,
     TraversalBuilder,
@@ -233,6 +234,7 @@ __all__ = [
     "EdgeResult",
     "RawEdge",
     "TraverseOptions",
+    "PropFilter",
     "PathFindingBuilder",
     "PathResult",
     
@@ -79,6 +79,7 @@ class DbStats:
     snapshot_nodes: int
     snapshot_edges: int
     snapshot_max_node_id: int
+    next_node_id: int
     delta_nodes_created: int
     delta_nodes_deleted: int
     delta_edges_added: int
@@ -380,6 +381,7 @@ class Database:
     def node_exists(self, node_id: int) -> bool: ...
     def get_node_by_key(self, key: str) -> Optional[int]: ...
     def get_node_key(self, node_id: int) -> Optional[str]: ...
+    def get_node_keys_batch(self, node_ids: List[int]) -> List[Optional[str]]: ...
     def list_nodes(self) -> List[int]: ...
     def count_nodes(self) -> int: ...
     def list_nodes_with_prefix(self, prefix: str) -> List[int]: ...
@@ -421,6 +423,7 @@ class Database:
     def set_node_prop_float(self, node_id: int, key_id: int, value: float) -> None: ...
     def set_node_prop_bool(self, node_id: int, key_id: int, value: bool) -> None: ...
     def get_node_props(self, node_id: int) -> Optional[List[NodeProp]]: ...
+    def get_node_props_batch(self, node_ids: List[int]) -> List[Optional[List[NodeProp]]]: ...
     
     # Edge property operations
     def set_edge_prop(self, src: int, etype: int, dst: int, key_id: int, value: PropValue) -> None: ...
@@ -497,6 +500,8 @@ class Database:
     def traverse_in(self, node_id: int, etype: Optional[int] = None) -> List[int]: ...
     def traverse_in_with_keys(self, node_id: int, etype: Optional[int] = None) -> List[Tuple[int, Optional[str]]]: ...
     def traverse_in_count(self, node_id: int, etype: Optional[int] = None) -> int: ...
+    def traverse_both(self, node_id: int, etype: Optional[int] = None) -> List[int]: ...
+    def traverse_both_with_keys(self, node_id: int, etype: Optional[int] = None) -> List[Tuple[int, Optional[str]]]: ...
     def traverse(
         self,
         node_id: int,
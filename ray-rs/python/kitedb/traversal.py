@@ -24,6 +24,7 @@ Example:
 
 from __future__ import annotations
 
+import operator
 from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
@@ -32,6 +33,7 @@ from typing import (
     Dict,
     Generator,
     Generic,
+    Iterable,
     Iterator,
     List,
     Literal,
@@ -51,6 +53,13 @@ if TYPE_CHECKING:
 
 N = TypeVar("N", bound=NodeDef)
 
+# Sentinel distinguishing "props not prefetched" from "node has no props".
+_MISSING: Any = object()
+
+# Cap for the dense visited-set (16M ids = 16 MiB); beyond this a bytearray
+# costs more to allocate than the hash probes it saves.
+_DENSE_VISITED_MAX_ID = 1 << 24
+
 
 # ============================================================================
 # Traversal Step Types
@@ -61,6 +70,8 @@ class OutStep:
     """Traverse outgoing edges."""
     type: Literal["out"] = "out"
     edge_def: Optional[EdgeDef] = None
+    # Resolved edge type id, cached on first execution.
+    etype_id: Optional[int] = None
 
 
 @dataclass
@@ -68,6 +79,7 @@ class InStep:
     """Traverse incoming edges."""
     type: Literal["in"] = "in"
     edge_def: Optional[EdgeDef] = None
+    etype_id: Optional[int] = None
 
 
 @dataclass
@@ -75,6 +87,7 @@ class BothStep:
     """Traverse both directions."""
     type: Literal["both"] = "both"
     edge_def: Optional[EdgeDef] = None
+    etype_id: Optional[int] = None
 
 
 @dataclass
@@ -94,11 +107,35 @@ class TraverseStep:
     type: Literal["traverse"] = "traverse"
     edge_def: Optional[EdgeDef] = None
     options: TraverseOptions = field(default_factory=lambda: TraverseOptions(max_depth=1))
+    etype_id: Optional[int] = None
 
 
 TraversalStep = Union[OutStep, InStep, BothStep, TraverseStep]
 
 
+_PROP_FILTER_OPS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+@dataclass
+class PropFilter:
+    """Structured node-property predicate.
+
+    Unlike where_node(lambda), this can be evaluated against raw property
+    values before any NodeRef is constructed, so rejected nodes never pay
+    for property conversion or allocation.
+    """
+    prop: str
+    op: Literal["==", "!=", "<", "<=", ">", ">="]
+    value: Any
+
+
 # ============================================================================
 # Property Loading Strategy
 # ============================================================================
@@ -182,6 +219,59 @@ class RawEdge:
     dst: int
 
 
+def _reify_node_refs(
+    db: Database,
+    node_ids: List[int],
+    get_node_def: Callable[[int], Optional[NodeDef]],
+    load_props: bool = True,
+) -> List[Optional[NodeRef[Any]]]:
+    """Build NodeRefs for a list of node ids with batched FFI fetches.
+
+    One get_node_keys_batch plus (optionally) one get_node_props_batch call
+    covers the whole id list, instead of two-plus-P calls per node. Entries
+    whose node definition cannot be resolved come back as None.
+    """
+    if not node_ids:
+        return []
+    unique_ids = list(dict.fromkeys(node_ids))
+    key_by_id = dict(zip(unique_ids, db.get_node_keys_batch(unique_ids)))
+    raw_props_by_id: Dict[int, Any] = {}
+    if load_props:
+        raw_props_by_id = dict(zip(unique_ids, db.get_node_props_batch(unique_ids)))
+
+    def_cache: Dict[int, Optional[NodeDef]] = {}
+    # key_id -> prop name mappings, built once per distinct node definition
+    key_maps: Dict[int, Dict[int, str]] = {}
+    refs: List[Optional[NodeRef[Any]]] = []
+    for node_id in node_ids:
+        if node_id in def_cache:
+            node_def = def_cache[node_id]
+        else:
+            node_def = get_node_def(node_id)
+            def_cache[node_id] = node_def
+        if node_def is None:
+            refs.append(None)
+            continue
+
+        key = key_by_id.get(node_id) or f"node:{node_id}"
+
+        props: Dict[str, Any] = {}
+        if load_props:
+            raw_props = raw_props_by_id.get(node_id)
+            if raw_props:
+                key_id_to_name = key_maps.get(id(node_def))
+                if key_id_to_name is None:
+                    key_id_to_name = {v: k for k, v in node_def._prop_key_ids.items()}
+                    key_maps[id(node_def)] = key_id_to_name
+                for node_prop in raw_props:
+                    prop_name = key_id_to_name.get(node_prop.key_id)
+                    if prop_name is not None:
+                        props[prop_name] = from_prop_value(node_prop.value)
+
+        refs.append(NodeRef(id=node_id, key=key, node_def=node_def, props=props))
+    return refs
+
+
 # ============================================================================
 # Traversal Result
 # ============================================================================
@@ -209,6 +299,8 @@ class TraversalResult(Generic[N]):
         resolve_prop_key_id: Callable[[NodeDef, str], int],
         get_node_def: Callable[[int], Optional[NodeDef]],
         prop_strategy: PropLoadStrategy,
+        prop_filters: Optional[List[PropFilter]] = None,
+        node_filter_props: Optional[Set[str]] = None,
     ):
         self._db = db
         self._start_nodes = start_nodes
@@ -220,23 +312,36 @@ class TraversalResult(Generic[N]):
         self._resolve_prop_key_id = resolve_prop_key_id
         self._get_node_def = get_node_def
         self._prop_strategy = prop_strategy
+        self._prop_filters = prop_filters or []
+        self._node_filter_props = node_filter_props
+        # Memoized per-execution: _get_node_def re-fetches the node key on
+        # every call, so cache its result per node id.
+        self._node_def_cache: Dict[int, Optional[NodeDef]] = {}
+        # Lazily cached id bound for dense visited-sets; None = not fetched
+        # yet, 0 = no usable bound. Fetching it costs a stats() FFI call.
+        self._visited_bound: Optional[int] = None
     
     def _load_node_props(
         self,
         node_id: int,
         node_def: NodeDef,
         prop_strategy: Optional[PropLoadStrategy] = None,
+        raw_props: Any = _MISSING,
     ) -> Dict[str, Any]:
-        """Load properties for a node based on strategy using single FFI call."""
+        """Load properties for a node based on strategy using single FFI call.
+
+        Pass `raw_props` (from get_node_props_batch) to skip the per-node
+        FFI call when the caller already fetched properties for a node set.
+        """
         props: Dict[str, Any] = {}
 
         strategy = prop_strategy or self._prop_strategy
 
         if not strategy.needs_any_props():
             return props
-        
+
         # Use get_node_props() for single FFI call instead of per-property calls
-        all_props = self._db.get_node_props(node_id)
+        all_props = self._db.get_node_props(node_id) if raw_props is _MISSING else raw_props
         if all_props is None:
             return props
         
@@ -276,32 +381,91 @@ class TraversalResult(Generic[N]):
         props = self._load_edge_props(edge_def, src, etype, dst)
         return EdgeResult(src=src, etype=etype, dst=dst, props=props)
     
+    def _get_node_def_cached(self, node_id: int) -> Optional[NodeDef]:
+        """Resolve a node's definition, memoized per node id."""
+        if node_id in self._node_def_cache:
+            return self._node_def_cache[node_id]
+        node_def = self._get_node_def(node_id)
+        self._node_def_cache[node_id] = node_def
+        return node_def
+
+    def _passes_prop_filters(self, node_def: NodeDef, raw_props: Any) -> bool:
+        """Evaluate structured prop filters against raw (unconverted) props."""
+        values: Dict[int, Any] = {}
+        if raw_props:
+            for node_prop in raw_props:
+                values[node_prop.key_id] = node_prop.value
+        for prop_filter in self._prop_filters:
+            key_id = node_def._prop_key_ids.get(prop_filter.prop)
+            if key_id is None:
+                return False
+            raw_value = values.get(key_id)
+            value = from_prop_value(raw_value) if raw_value is not None else None
+            if value is None:
+                return False
+            try:
+                if not _PROP_FILTER_OPS[prop_filter.op](value, prop_filter.value):
+                    return False
+            except TypeError:
+                return False
+        return True
+
     def _create_node_ref(
         self,
         node_id: int,
         load_props: bool = False,
         prop_strategy: Optional[PropLoadStrategy] = None,
+        raw_props: Any = _MISSING,
+        node_def: Optional[NodeDef] = None,
+        key: Optional[str] = None,
     ) -> Optional[NodeRef[Any]]:
         """Create a NodeRef from a node ID."""
-        node_def = self._get_node_def(node_id)
+        if node_def is None:
+            node_def = self._get_node_def_cached(node_id)
         if node_def is None:
             return None
-        
-        key = self._db.get_node_key(node_id)
+
+        if key is None:
+            key = self._db.get_node_key(node_id)
         if key is None:
             key = f"node:{node_id}"
-        
+
         if load_props:
-            props = self._load_node_props(node_id, node_def, prop_strategy=prop_strategy)
+            props = self._load_node_props(
+                node_id, node_def, prop_strategy=prop_strategy, raw_props=raw_props
+            )
         else:
             props = {}
-        
+
         return NodeRef(id=node_id, key=key, node_def=node_def, props=props)
     
     def _create_node_ref_fast(self, node_id: int, node_def: NodeDef) -> NodeRef[Any]:
         """Create a minimal NodeRef without loading key or properties."""
         return NodeRef(id=node_id, key="", node_def=node_def, props={})
 
+    def _new_visited(self) -> Union[bytearray, Set[int]]:
+        """Visited-set used for frontier dedup.
+
+        For graphs with a bounded id space a bytearray indexed by node id
+        turns each membership check into a C-level byte load instead of a
+        Python set hash probe. next_node_id is the allocator's exclusive
+        upper bound on every existing id, including ones picked explicitly
+        via upsert_by_id. Falls back to a set when the bound is unavailable
+        or too large (e.g. sparse ids from create_node_with_id). The bound
+        is fetched at most once per TraversalResult.
+        """
+        if self._visited_bound is None:
+            try:
+                bound = int(self._db.stats().next_node_id)
+            except Exception:
+                bound = 0
+            if not 0 < bound <= _DENSE_VISITED_MAX_ID:
+                bound = 0
+            self._visited_bound = bound
+        if self._visited_bound:
+            return bytearray(self._visited_bound)
+        return set()
+
     def _has_traverse_step(self) -> bool:
         return any(isinstance(step, TraverseStep) for step in self._steps)
 
@@ -309,6 +473,7 @@ class TraversalResult(Generic[N]):
         return (
             self._edge_filter is not None
             or self._node_filter is not None
+            or bool(self._prop_filters)
             or self._prop_strategy.needs_any_props()
             or self._limit is not None
             or self._has_traverse_step()
@@ -318,26 +483,24 @@ class TraversalResult(Generic[N]):
         return (
             self._edge_filter is not None
             or self._node_filter is not None
+            or bool(self._prop_filters)
             or self._limit is not None
             or self._has_traverse_step()
         )
 
-    def _execute_single_hop(
+    def _execute_single_hop_raw(
         self,
         node: NodeRef[Any],
         step: Union[OutStep, InStep, BothStep],
-    ) -> Generator[Tuple[NodeRef[Any], EdgeResult], None, None]:
-        """Execute a single-hop step and yield (node, edge) pairs."""
+        etype_id: Optional[int],
+    ) -> Generator[Tuple[int, EdgeResult], None, None]:
+        """Execute a single-hop step and yield (neighbor_id, edge) pairs."""
         directions: List[str]
         if step.type == "both":
             directions = ["out", "in"]
         else:
             directions = [step.type]
 
-        etype_id: Optional[int] = None
-        if step.edge_def is not None:
-            etype_id = self._resolve_etype_id(step.edge_def)
-
         for direction in directions:
             if direction == "out":
                 edges = self._db.get_out_edges(node.id)
@@ -345,22 +508,80 @@ class TraversalResult(Generic[N]):
                     if etype_id is not None and edge.etype != etype_id:
                         continue
                     neighbor_id = edge.node_id
-                    neighbor_ref = self._create_node_ref(neighbor_id, load_props=self._prop_strategy.needs_any_props())
-                    if neighbor_ref is None:
-                        continue
                     edge_result = self._build_edge_result(step.edge_def, node.id, edge.etype, neighbor_id)
-                    yield neighbor_ref, edge_result
+                    yield neighbor_id, edge_result
             else:
                 edges = self._db.get_in_edges(node.id)
                 for edge in edges:
                     if etype_id is not None and edge.etype != etype_id:
                         continue
                     neighbor_id = edge.node_id
-                    neighbor_ref = self._create_node_ref(neighbor_id, load_props=self._prop_strategy.needs_any_props())
-                    if neighbor_ref is None:
-                        continue
                     edge_result = self._build_edge_result(step.edge_def, neighbor_id, edge.etype, node.id)
-                    yield neighbor_ref, edge_result
+                    yield neighbor_id, edge_result
+
+    def _step_etype_id(self, step: TraversalStep) -> Optional[int]:
+        """Resolve a step's edge type id, caching it on the step object.
+
+        Builders return themselves, so a re-executed builder pays the
+        name-to-id lookup only on its first run.
+        """
+        if step.etype_id is None and step.edge_def is not None:
+            step.etype_id = self._resolve_etype_id(step.edge_def)
+        return step.etype_id
+
+    def _expand_single_hop(
+        self,
+        frontier: List[NodeRef[Any]],
+        step: Union[OutStep, InStep, BothStep],
+        apply_prop_filters: bool = False,
+    ) -> List[Tuple[NodeRef[Any], EdgeResult]]:
+        """Expand one single-hop step for the whole frontier.
+
+        Collects raw (neighbor_id, edge) pairs first so properties for the
+        entire frontier can be fetched with one get_node_props_batch call
+        instead of one FFI round trip per neighbor. When this is the final
+        step, structured prop filters reject neighbors here, before any
+        NodeRef is built for them.
+        """
+        # Loop-invariant: resolve the edge type once per step, not per node.
+        etype_id = self._step_etype_id(step)
+
+        raw: List[Tuple[int, EdgeResult]] = []
+        for node in frontier:
+            raw.extend(self._execute_single_hop_raw(node, step, etype_id))
+
+        filtering = apply_prop_filters and bool(self._prop_filters)
+        load_props = self._prop_strategy.needs_any_props()
+        raw_props_by_id: Dict[int, Any] = {}
+        key_by_id: Dict[int, Optional[str]] = {}
+        if raw:
+            unique_ids = list(dict.fromkeys(neighbor_id for neighbor_id, _ in raw))
+            key_by_id = dict(zip(unique_ids, self._db.get_node_keys_batch(unique_ids)))
+            if load_props or filtering:
+                raw_props_by_id = dict(
+                    zip(unique_ids, self._db.get_node_props_batch(unique_ids))
+                )
+
+        results: List[Tuple[NodeRef[Any], EdgeResult]] = []
+        for neighbor_id, edge_result in raw:
+            node_def = self._get_node_def_cached(neighbor_id)
+            if node_def is None:
+                continue
+            if filtering and not self._passes_prop_filters(
+                node_def, raw_props_by_id.get(neighbor_id)
+            ):
+                continue
+            neighbor_ref = self._create_node_ref(
+                neighbor_id,
+                load_props=load_props,
+                raw_props=raw_props_by_id.get(neighbor_id) if load_props else _MISSING,
+                node_def=node_def,
+                key=key_by_id.get(neighbor_id),
+            )
+            if neighbor_ref is None:
+                continue
+            results.append((neighbor_ref, edge_result))
+        return results
 
     def _iter_traverse_edges(
         self,
@@ -413,6 +634,8 @@ class TraversalResult(Generic[N]):
 
         load_props = prop_strategy.needs_any_props()
 
+        # Runs once per frontier node, so a dense visited-set would mean an
+        # allocation per call; a plain set is the right size here.
         visited: Set[int] = set()
         if options.unique:
             visited.add(node.id)
@@ -460,12 +683,10 @@ class TraversalResult(Generic[N]):
         self,
         node: NodeRef[Any],
         step: TraverseStep,
+        etype_id: Optional[int],
     ) -> Generator[Tuple[NodeRef[Any], EdgeResult], None, None]:
         """Execute variable-depth traversal from a node."""
         options = step.options
-        etype_id: Optional[int] = None
-        if step.edge_def is not None:
-            etype_id = self._resolve_etype_id(step.edge_def)
 
         if options.where_node is not None or options.where_edge is not None:
             yield from self._execute_traverse_filtered(node, step, etype_id)
@@ -499,26 +720,76 @@ class TraversalResult(Generic[N]):
             )
             yield node_ref, edge_result
 
-    def _iter_results(self) -> Generator[Tuple[NodeRef[Any], Optional[EdgeResult]], None, None]:
-        """Full execution path that yields (node, edge) results."""
+    def _iter_results(
+        self, unique_nodes: bool = False
+    ) -> Generator[Tuple[NodeRef[Any], Optional[EdgeResult]], None, None]:
+        """Full execution path that yields (node, edge) results.
+
+        unique_nodes dedups every single-hop frontier by node id (first
+        passing edge wins), matching the set semantics of the Rust
+        traverse_multi fused path. Node-result consumers pass True so the
+        fused and fallback paths agree on multiplicity; edge results keep
+        per-edge multiplicity.
+        """
         current_results: List[Tuple[NodeRef[Any], Optional[EdgeResult]]] = [
             (node, None) for node in self._start_nodes
         ]
 
-        for step in self._steps:
+        prop_filters_applied = False
+        edge_filter_applied = False
+        for index, step in enumerate(self._steps):
             next_results: List[Tuple[NodeRef[Any], EdgeResult]] = []
-            for node, _ in current_results:
-                if isinstance(step, TraverseStep):
-                    for result in self._execute_traverse(node, step):
+            if isinstance(step, TraverseStep):
+                etype_id = self._step_etype_id(step)
+                for node, _ in current_results:
+                    for result in self._execute_traverse(node, step, etype_id):
                         next_results.append(result)
+                current_results = [(n, e) for n, e in next_results]
+            else:
+                is_last = index == len(self._steps) - 1
+                next_results = self._expand_single_hop(
+                    [n for n, _ in current_results], step, apply_prop_filters=is_last
+                )
+                prop_filters_applied = prop_filters_applied or is_last
+                if unique_nodes:
+                    # The edge filter only constrains final edges; apply it
+                    # before deduping so a node reached via several edges
+                    # survives whenever any of its edges passes.
+                    edge_filter = self._edge_filter if is_last else None
+                    seen: Set[int] = set()
+                    current_results = []
+                    for n, e in next_results:
+                        if edge_filter is not None and not edge_filter(e):
+                            continue
+                        if n.id in seen:
+                            continue
+                        seen.add(n.id)
+                        current_results.append((n, e))
+                    edge_filter_applied = edge_filter_applied or edge_filter is not None
                 else:
-                    for result in self._execute_single_hop(node, step):
-                        next_results.append(result)
-            current_results = [(n, e) for n, e in next_results]
+                    current_results = [(n, e) for n, e in next_results]
+
+        # Prop filters only constrain final results; when the last step could
+        # not apply them during expansion (traverse step or no steps), filter
+        # the remaining candidates here with one batched property fetch.
+        if self._prop_filters and not prop_filters_applied and current_results:
+            candidate_ids = [node.id for node, _ in current_results]
+            raw_props_by_id = dict(
+                zip(candidate_ids, self._db.get_node_props_batch(candidate_ids))
+            )
+            current_results = [
+                (node, edge)
+                for node, edge in current_results
+                if self._passes_prop_filters(node.node_def, raw_props_by_id.get(node.id))
+            ]
 
         count = 0
         for node, edge in current_results:
-            if edge is not None and self._edge_filter is not None:
+            if (
+                edge is not None
+                and self._edge_filter is not None
+                and not edge_filter_applied
+            ):
                 if not self._edge_filter(edge):
                     continue
             if self._node_filter is not None and not self._node_filter(node):
@@ -538,11 +809,7 @@ class TraversalResult(Generic[N]):
         """Build step tuples for Rust traverse_multi call."""
         rust_steps = []
         for step in self._steps:
-            etype_id = None
-            if step.edge_def is not None:
-                etype_id = step.edge_def._etype_id
-                if etype_id is None:
-                    etype_id = self._resolve_etype_id(step.edge_def)
+            etype_id = self._step_etype_id(step)
             rust_steps.append((step.type, etype_id))
         return rust_steps
     
@@ -561,27 +828,28 @@ class TraversalResult(Generic[N]):
         # For multi-step, use Rust batch traversal
         if len(self._steps) == 1:
             step = self._steps[0]
-            etype_id = None
-            if step.edge_def is not None:
-                etype_id = step.edge_def._etype_id
-                if etype_id is None:
-                    etype_id = self._resolve_etype_id(step.edge_def)
+            etype_id = self._step_etype_id(step)
             
-            visited: Set[int] = set()
+            visited = self._new_visited()
+            dense = isinstance(visited, bytearray)
             for node in self._start_nodes:
                 if step.type == "out":
                     neighbor_ids = self._db.traverse_out(node.id, etype_id)
                 elif step.type == "in":
                     neighbor_ids = self._db.traverse_in(node.id, etype_id)
                 else:  # both
-                    out_ids = self._db.traverse_out(node.id, etype_id)
-                    in_ids = self._db.traverse_in(node.id, etype_id)
-                    neighbor_ids = list(set(out_ids) | set(in_ids))
-                
-                for neighbor_id in neighbor_ids:
-                    if neighbor_id not in visited:
-                        visited.add(neighbor_id)
-                        yield neighbor_id
+                    neighbor_ids = self._db.traverse_both(node.id, etype_id)
+
+                if dense:
+                    for neighbor_id in neighbor_ids:
+                        if not visited[neighbor_id]:
+                            visited[neighbor_id] = 1
+                            yield neighbor_id
+                else:
+                    for neighbor_id in neighbor_ids:
+                        if neighbor_id not in visited:
+                            visited.add(neighbor_id)
+                            yield neighbor_id
         else:
             # Multi-step: use Rust batch traversal
             start_ids = [node.id for node in self._start_nodes]
@@ -605,32 +873,28 @@ class TraversalResult(Generic[N]):
         # For single step, use direct batch call (lower overhead)
         if len(self._steps) == 1:
             step = self._steps[0]
-            etype_id = None
-            if step.edge_def is not None:
-                etype_id = step.edge_def._etype_id
-                if etype_id is None:
-                    etype_id = self._resolve_etype_id(step.edge_def)
+            etype_id = self._step_etype_id(step)
             
-            visited: Set[int] = set()
+            visited = self._new_visited()
+            dense = isinstance(visited, bytearray)
             for node in self._start_nodes:
                 if step.type == "out":
                     pairs = self._db.traverse_out_with_keys(node.id, etype_id)
                 elif step.type == "in":
                     pairs = self._db.traverse_in_with_keys(node.id, etype_id)
                 else:  # both
-                    out_pairs = self._db.traverse_out_with_keys(node.id, etype_id)
-                    in_pairs = self._db.traverse_in_with_keys(node.id, etype_id)
-                    seen = set()
-                    pairs = []
-                    for nid, key in out_pairs + in_pairs:
-                        if nid not in seen:
-                            seen.add(nid)
-                            pairs.append((nid, key))
-                
-                for neighbor_id, key in pairs:
-                    if neighbor_id not in visited:
-                        visited.add(neighbor_id)
-                        yield (neighbor_id, key or f"node:{neighbor_id}")
+                    pairs = self._db.traverse_both_with_keys(node.id, etype_id)
+
+                if dense:
+                    for neighbor_id, key in pairs:
+                        if not visited[neighbor_id]:
+                            visited[neighbor_id] = 1
+                            yield (neighbor_id, key or f"node:{neighbor_id}")
+                else:
+                    for neighbor_id, key in pairs:
+                        if neighbor_id not in visited:
+                            visited.add(neighbor_id)
+                            yield (neighbor_id, key or f"node:{neighbor_id}")
         else:
             # Multi-step: use Rust batch traversal
             start_ids = [node.id for node in self._start_nodes]
@@ -639,6 +903,66 @@ class TraversalResult(Generic[N]):
             for node_id, key in results:
                 yield (node_id, key or f"node:{node_id}")
     
+    def _can_fuse_steps(self) -> bool:
+        """Whether the whole step chain can run in one traverse_multi call.
+
+        Fusion is possible when no Python predicate has to run between hops;
+        structured prop filters and limit only constrain final results and
+        are applied after the fused traversal.
+        """
+        return (
+            bool(self._steps)
+            and not self._has_traverse_step()
+            and self._node_filter is None
+            and self._edge_filter is None
+        )
+
+    def _fused_rows(self) -> List[Tuple[int, str, NodeDef, Any]]:
+        """Run the step chain in one boundary call; return raw result rows.
+
+        One traverse_multi call replaces per-node hop expansion, and one
+        get_node_props_batch call fetches properties for the terminal
+        frontier. Rows are (node_id, key, node_def, raw_props) with raw
+        (unconverted) property lists: _execute_fused turns them into props
+        dicts, while to_columns decodes them straight into columns.
+        """
+        start_ids = [node.id for node in self._start_nodes]
+        rust_steps = self._build_steps_for_rust()
+        results = self._db.traverse_multi(start_ids, rust_steps)
+
+        load_props = self._prop_strategy.needs_any_props()
+        raw_props_by_id: Dict[int, Any] = {}
+        if (load_props or self._prop_filters) and results:
+            unique_ids = list(dict.fromkeys(node_id for node_id, _ in results))
+            raw_props_by_id = dict(zip(unique_ids, self._db.get_node_props_batch(unique_ids)))
+
+        rows: List[Tuple[int, str, NodeDef, Any]] = []
+        for node_id, key in results:
+            # Check before appending so take(0) yields no results, matching
+            # the pre-yield limit check in _iter_results.
+            if self._limit is not None and len(rows) >= self._limit:
+                break
+            node_def = self._get_node_def_cached(node_id)
+            if node_def is None:
+                continue
+            raw_props = raw_props_by_id.get(node_id)
+            if self._prop_filters and not self._passes_prop_filters(node_def, raw_props):
+                continue
+            rows.append((node_id, key or f"node:{node_id}", node_def, raw_props))
+        return rows
+
+    def _execute_fused(self) -> List[NodeRef[Any]]:
+        """Run the step chain in a single boundary call and reify the results."""
+        load_props = self._prop_strategy.needs_any_props()
+        refs: List[NodeRef[Any]] = []
+        for node_id, key, node_def, raw_props in self._fused_rows():
+            if load_props:
+                props = self._load_node_props(node_id, node_def, raw_props=raw_props)
+            else:
+                props = {}
+            refs.append(NodeRef(id=node_id, key=key, node_def=node_def, props=props))
+        return refs
+
     def _execute_fast_count(self) -> int:
         """Execute traversal and return just the count."""
         if self._has_traverse_step():
@@ -649,27 +973,29 @@ class TraversalResult(Generic[N]):
         # For single step, count directly
         if len(self._steps) == 1:
             step = self._steps[0]
-            etype_id = None
-            if step.edge_def is not None:
-                etype_id = step.edge_def._etype_id
-                if etype_id is None:
-                    etype_id = self._resolve_etype_id(step.edge_def)
+            etype_id = self._step_etype_id(step)
             
-            visited: Set[int] = set()
+            visited = self._new_visited()
+            dense = isinstance(visited, bytearray)
+            count = 0
             for node in self._start_nodes:
                 if step.type == "out":
                     neighbor_ids = self._db.traverse_out(node.id, etype_id)
                 elif step.type == "in":
                     neighbor_ids = self._db.traverse_in(node.id, etype_id)
                 else:  # both
-                    out_ids = self._db.traverse_out(node.id, etype_id)
-                    in_ids = self._db.traverse_in(node.id, etype_id)
-                    neighbor_ids = list(set(out_ids) | set(in_ids))
-                
-                for neighbor_id in neighbor_ids:
-                    visited.add(neighbor_id)
-            
-            return len(visited)
+                    neighbor_ids = self._db.traverse_both(node.id, etype_id)
+
+                if dense:
+                    for neighbor_id in neighbor_ids:
+                        if not visited[neighbor_id]:
+                            visited[neighbor_id] = 1
+                            count += 1
+                else:
+                    for neighbor_id in neighbor_ids:
+                        visited.add(neighbor_id)
+
+            return count if dense else len(visited)
         else:
             # Multi-step: use Rust batch traversal count
             start_ids = [node.id for node in self._start_nodes]
@@ -681,12 +1007,16 @@ class TraversalResult(Generic[N]):
         if not self._needs_full_execution():
             # Ultra-fast path: use batch operation to get IDs + keys in one call
             for node_id, key in self._execute_fast_with_keys():
-                node_def = self._get_node_def(node_id)
+                node_def = self._get_node_def_cached(node_id)
                 if node_def is not None:
                     yield NodeRef(id=node_id, key=key, node_def=node_def, props={})
             return
 
-        for node_ref, _ in self._iter_results():
+        if self._can_fuse_steps():
+            yield from self._execute_fused()
+            return
+
+        for node_ref, _ in self._iter_results(unique_nodes=True):
             yield node_ref
     
     def __iter__(self) -> Iterator[NodeRef[Any]]:
@@ -703,17 +1033,114 @@ class TraversalResult(Generic[N]):
         if not self._needs_full_execution():
             results: List[NodeRef[N]] = []
             for node_id, key in self._execute_fast_with_keys():
-                node_def = self._get_node_def(node_id)
+                node_def = self._get_node_def_cached(node_id)
                 if node_def is not None:
                     results.append(NodeRef(id=node_id, key=key, node_def=node_def, props={}))  # type: ignore
             return results
 
+        if self._can_fuse_steps():
+            return self._execute_fused()  # type: ignore
+
         return list(self._execute())  # type: ignore
     
+    @staticmethod
+    def _column_array(np: Any, values: List[Any]) -> Any:
+        """Pick the narrowest numpy dtype a value column fits in."""
+        if all(isinstance(v, bool) for v in values):
+            return np.asarray(values, dtype=bool)
+        if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+            return np.asarray(values, dtype=np.int64)
+        if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+            return np.asarray(values, dtype=np.float64)
+        # Missing or heterogeneous values stay as an object column.
+        return np.asarray(values, dtype=object)
+
+    def _columns_from_rows(
+        self, np: Any, rows: List[Tuple[int, str, NodeDef, Any]]
+    ) -> Dict[str, Any]:
+        """Decode fused result rows into columns without props dicts."""
+        columns: Dict[str, Any] = {
+            "id": np.asarray([node_id for node_id, _, _, _ in rows], dtype=np.int64),
+            "key": [key for _, key, _, _ in rows],
+        }
+        strategy = self._prop_strategy
+        if not strategy.needs_any_props():
+            return columns
+
+        # key_id -> prop name mappings, built once per distinct node definition
+        key_maps: Dict[int, Dict[int, str]] = {}
+        prop_names: List[str] = []
+        values_by_name: Dict[str, List[Any]] = {}
+        for index, (_, _, node_def, raw_props) in enumerate(rows):
+            if not raw_props:
+                continue
+            key_id_to_name = key_maps.get(id(node_def))
+            if key_id_to_name is None:
+                key_id_to_name = {v: k for k, v in node_def._prop_key_ids.items()}
+                key_maps[id(node_def)] = key_id_to_name
+            for node_prop in raw_props:
+                name = key_id_to_name.get(node_prop.key_id)
+                if name is None or not strategy.should_load(name):
+                    continue
+                values = values_by_name.get(name)
+                if values is None:
+                    values = [None] * len(rows)
+                    values_by_name[name] = values
+                    prop_names.append(name)
+                values[index] = from_prop_value(node_prop.value)
+
+        for name in prop_names:
+            columns[name] = self._column_array(np, values_by_name[name])
+        return columns
+
+    def to_columns(self) -> Dict[str, Any]:
+        """
+        Execute the traversal and collect results column-oriented.
+
+        Returns one array per property plus "id" and "key" columns. On the
+        fused path property values are decoded straight from the batched
+        raw fetch, so wide results skip the per-node props dict entirely;
+        numeric columns support vectorized predicates (e.g.
+        `cols["age"] < 35`). Requires numpy (`pip install kitedb[numpy]`).
+
+        Returns:
+            Dict mapping column name to a numpy array ("key" is a list)
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ImportError(
+                "to_columns() requires numpy; install with `pip install kitedb[numpy]`"
+            ) from exc
+
+        if self._can_fuse_steps():
+            return self._columns_from_rows(np, self._fused_rows())
+
+        # Python predicates need reified NodeRefs; transpose their props.
+        nodes = self.to_list()
+        columns: Dict[str, Any] = {
+            "id": np.asarray([node.id for node in nodes], dtype=np.int64),
+            "key": [node.key for node in nodes],
+        }
+
+        prop_names: List[str] = []
+        seen: Set[str] = set()
+        for node in nodes:
+            for name in node.props:
+                if name not in seen:
+                    seen.add(name)
+                    prop_names.append(name)
+
+        for name in prop_names:
+            columns[name] = self._column_array(
+                np, [node.props.get(name) for node in nodes]
+            )
+        return columns
+
     def first(self) -> Optional[NodeRef[N]]:
         """
         Execute the traversal and return the first result.
-        
+
         Returns:
             First NodeRef or None if no results
         """
@@ -724,15 +1151,72 @@ class TraversalResult(Generic[N]):
     def count(self) -> int:
         """
         Execute the traversal and count results.
-        
+
         This is optimized to not load properties when counting.
-        
+
         Returns:
             Number of matching nodes
         """
-        if not self._needs_full_execution_for_scalar() and self._node_filter is None:
-            return self._execute_fast_count()
+        if (
+            self._node_filter is None
+            and self._edge_filter is None
+            and not self._has_traverse_step()
+        ):
+            return self._count_without_refs()
+        if self._node_filter is not None and self._node_filter_props is not None:
+            # The predicate declared which props it reads; skip the rest.
+            original_strategy = self._prop_strategy
+            self._prop_strategy = (
+                PropLoadStrategy.only(*self._node_filter_props)
+                if self._node_filter_props
+                else PropLoadStrategy.none()
+            )
+            try:
+                return sum(1 for _ in self._execute())
+            finally:
+                self._prop_strategy = original_strategy
         return sum(1 for _ in self._execute())
+
+    def _count_without_refs(self) -> int:
+        """Count results without materializing any NodeRef.
+
+        With no node or edge filter the caller never observes keys or
+        properties, so counting needs only node ids from the native
+        traversal. Structured prop filters are evaluated against raw
+        property lists from one batched fetch.
+        """
+        start_ids = [node.id for node in self._start_nodes]
+        if not self._steps:
+            final_ids = start_ids
+        elif not self._prop_filters:
+            total = self._execute_fast_count()
+            return total if self._limit is None else min(self._limit, total)
+        else:
+            # traverse_multi yields (node_id, key) pairs; only the ids matter here.
+            final_ids = [
+                node_id
+                for node_id, _ in self._db.traverse_multi(
+                    start_ids, self._build_steps_for_rust()
+                )
+            ]
+
+        if self._prop_filters:
+            raw_props_list = self._db.get_node_props_batch(final_ids)
+            count = 0
+            for node_id, raw_props in zip(final_ids, raw_props_list):
+                node_def = self._get_node_def_cached(node_id)
+                if node_def is None:
+                    continue
+                if not self._passes_prop_filters(node_def, raw_props):
+                    continue
+                count += 1
+                if self._limit is not None and count >= self._limit:
+                    break
+            return count
+
+        if self._limit is not None:
+            return min(self._limit, len(final_ids))
+        return len(final_ids)
     
     def ids(self) -> List[int]:
         """
@@ -743,7 +1227,7 @@ class TraversalResult(Generic[N]):
         """
         if not self._needs_full_execution_for_scalar():
             return list(self._execute_fast())
-        return [node.id for node, _ in self._iter_results()]
+        return [node.id for node, _ in self._iter_results(unique_nodes=True)]
     
     def keys(self) -> List[str]:
         """
@@ -760,7 +1244,7 @@ class TraversalResult(Generic[N]):
                     result.append(key)
             return result
 
-        return [node.key for node, _ in self._iter_results() if node.key]
+        return [node.key for node, _ in self._iter_results(unique_nodes=True) if node.key]
 
 
 class EdgeTraversalResult:
@@ -824,6 +1308,8 @@ class TraversalBuilder(Generic[N]):
         self._edge_filter: Optional[Callable[[EdgeResult], bool]] = None
         self._limit: Optional[int] = None
         self._prop_strategy: PropLoadStrategy = PropLoadStrategy.all()
+        self._prop_filters: List[PropFilter] = []
+        self._node_filter_props: Optional[Set[str]] = None
 
     def _fork(self) -> "TraversalBuilder[N]":
         clone = TraversalBuilder(
@@ -837,6 +1323,10 @@ class TraversalBuilder(Generic[N]):
         clone._node_filter = self._node_filter
         clone._edge_filter = self._edge_filter
         clone._limit = self._limit
+        clone._prop_filters = list(self._prop_filters)
+        clone._node_filter_props = (
+            set(self._node_filter_props) if self._node_filter_props is not None else None
+        )
         prop_names = (
             set(self._prop_strategy.prop_names)
             if self._prop_strategy.prop_names is not None
@@ -971,19 +1461,56 @@ class TraversalBuilder(Generic[N]):
         clone._limit = limit
         return clone
     
-    def where_node(self, predicate: Callable[[NodeRef[Any]], bool]) -> TraversalBuilder[N]:
+    def where_prop(self, prop: str, op: str, value: Any) -> TraversalBuilder[N]:
+        """
+        Filter final nodes by a structured property comparison.
+
+        Unlike where_node(lambda), the predicate is evaluated against raw
+        property values before NodeRef construction, so rejected nodes never
+        pay for property conversion, and property loading is not forced on.
+
+        Args:
+            prop: Property name to compare
+            op: One of "==", "!=", "<", "<=", ">", ">="
+            value: Value to compare against
+
+        Returns:
+            Self for chaining
+
+        Example:
+            >>> young_friends = (
+            ...     db.from_(alice)
+            ...     .out(knows)
+            ...     .where_prop("age", "<", 35)
+            ...     .to_list()
+            ... )
+        """
+        if op not in _PROP_FILTER_OPS:
+            raise ValueError(f"Unknown prop filter operator: {op}")
+        clone = self._fork()
+        clone._prop_filters.append(PropFilter(prop=prop, op=op, value=value))  # type: ignore
+        return clone
+
+    def where_node(
+        self,
+        predicate: Callable[[NodeRef[Any]], bool],
+        required_props: Optional[Iterable[str]] = None,
+    ) -> TraversalBuilder[N]:
         """
         Filter nodes by a predicate.
-        
+
         Note: Using a filter will automatically load all properties
-        since the predicate may access any property.
-        
+        since the predicate may access any property. Pass required_props
+        to declare which properties the predicate reads; scalar paths
+        like count() then skip loading the rest.
+
         Args:
             predicate: Function that returns True for nodes to include
-        
+            required_props: Property names the predicate accesses, if known
+
         Returns:
             Self for chaining
-        
+
         Example:
             >>> young_friends = (
             ...     db.from_(alice)
@@ -996,6 +1523,8 @@ class TraversalBuilder(Generic[N]):
         clone._node_filter = predicate
         # Filter needs properties to work, so enable loading all
         clone._prop_strategy = PropLoadStrategy.all()
+        if required_props is not None:
+            clone._node_filter_props = set(required_props)
         return clone
     
     def _build_result(self) -> TraversalResult[N]:
@@ -1011,6 +1540,8 @@ class TraversalBuilder(Generic[N]):
             resolve_prop_key_id=self._resolve_prop_key_id,
             get_node_def=self._get_node_def,
             prop_strategy=self._prop_strategy,
+            prop_filters=list(self._prop_filters),
+            node_filter_props=self._node_filter_props,
         )
     
     def nodes(self) -> TraversalResult[N]:
@@ -1043,9 +1574,9 @@ class TraversalBuilder(Generic[N]):
             else:
                 directions = [step.type]
 
-            etype_id: Optional[int] = None
-            if step.edge_def is not None:
-                etype_id = self._resolve_etype_id(step.edge_def)
+            if step.etype_id is None and step.edge_def is not None:
+                step.etype_id = self._resolve_etype_id(step.edge_def)
+            etype_id = step.etype_id
 
             next_ids: List[int] = []
 
@@ -1077,10 +1608,19 @@ class TraversalBuilder(Generic[N]):
         """
         return self._build_result().to_list()
     
+    def to_columns(self) -> Dict[str, Any]:
+        """
+        Shortcut for .nodes().to_columns()
+
+        Returns:
+            Dict mapping column name to a numpy array ("key" is a list)
+        """
+        return self._build_result().to_columns()
+
     def first(self) -> Optional[NodeRef[N]]:
         """
         Shortcut for .nodes().first()
-        
+
         Returns:
             First NodeRef or None
         """
@@ -1225,23 +1765,9 @@ class PathFindingBuilder(Generic[N]):
     
     def _create_node_ref(self, node_id: int) -> Optional[NodeRef[Any]]:
         """Create a NodeRef from a node ID."""
-        node_def = self._get_node_def(node_id)
-        if node_def is None:
-            return None
-        
-        key = self._db.get_node_key(node_id)
-        if key is None:
-            key = f"node:{node_id}"
-        
-        props: Dict[str, Any] = {}
-        if self._load_props:
-            for prop_name, prop_def in node_def.props.items():
-                prop_key_id = self._resolve_prop_key_id(node_def, prop_name)
-                prop_value = self._db.get_node_prop(node_id, prop_key_id)
-                if prop_value is not None:
-                    props[prop_name] = from_prop_value(prop_value)
-        
-        return NodeRef(id=node_id, key=key, node_def=node_def, props=props)
+        return _reify_node_refs(
+            self._db, [node_id], self._get_node_def, load_props=self._load_props
+        )[0]
 
     def _get_targets(self) -> List[NodeRef[Any]]:
         if not self._targets:
@@ -1319,22 +1845,29 @@ class PathFindingBuilder(Generic[N]):
         parents: Dict[int, Tuple[Optional[int], Optional[EdgeResult]]],
         target_id: int,
     ) -> PathResult[N]:
-        path_nodes: List[NodeRef[N]] = []
+        path_ids: List[int] = []
         path_edges: List[EdgeResult] = []
 
         current: Optional[int] = target_id
         while current is not None:
             parent, edge = parents.get(current, (None, None))
-            node_ref = self._create_node_ref(current)
-            if node_ref is not None:
-                path_nodes.append(node_ref)  # type: ignore
+            path_ids.append(current)
             if edge is not None:
                 path_edges.append(edge)
             current = parent
 
-        path_nodes.reverse()
+        path_ids.reverse()
         path_edges.reverse()
 
+        # Reify the whole path in one batched fetch rather than per node.
+        path_nodes: List[NodeRef[N]] = [
+            ref  # type: ignore
+            for ref in _reify_node_refs(
+                self._db, path_ids, self._get_node_def, load_props=self._load_props
+            )
+            if ref is not None
+        ]
+
         return PathResult(nodes=path_nodes, found=True, total_weight=0.0, edges=path_edges)
     
     def find(self) -> PathResult[N]:
@@ -1541,6 +2074,7 @@ __all__ = [
     "EdgeResult",
     "RawEdge",
     "TraverseOptions",
+    "PropFilter",
     "PropLoadStrategy",
     "OutStep",
     "InStep",
@@ -0,0 +1,273 @@
+import os
+import tempfile
+import pytest
+
+from kitedb import define_edge, define_node, prop, kite
+from kitedb.builders import NodeRef
+
+
+def _build_schema():
+    user = define_node(
+        "user",
+        key=lambda id: f"user:{id}",
+        props={
+            "name": prop.string("name"),
+            "age": prop.int("age"),
+        },
+    )
+
+    knows = define_edge(
+        "knows",
+        {
+            "since": prop.int("since"),
+        },
+    )
+
+    return user, knows
+
+
+def test_fast_paths_with_sparse_high_node_id():
+    user, knows = _build_schema()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "traversal.kitedb")
+        with kite(path, nodes=[user], edges=[knows]) as db:
+            alice = db.insert(user).values(key="alice", name="Alice", age=30).returning()
+            # upsert_by_id places ids far beyond the created-node count; the
+            # dense visited-set fast paths must still cover them.
+            db.upsert_by_id(user, 500000).set(name="Far", age=99).execute()
+            far = NodeRef(id=500000, key="user:far", node_def=user, props={})
+            db.link(alice, knows, far, since=2024)
+
+            assert db.from_(alice).out(knows).ids() == [500000]
+            assert db.from_(alice).out(knows).count() == 1
+            assert [n.id for n in db.from_(alice).out(knows).to_list()] == [500000]
+
+
+def _build_diamond(db, user, knows):
+    a = db.insert(user).values(key="a", name="A", age=1).returning()
+    b = db.insert(user).values(key="b", name="B", age=2).returning()
+    c = db.insert(user).values(key="c", name="C", age=3).returning()
+    d = db.insert(user).values(key="d", name="D", age=4).returning()
+
+    db.link(a, knows, b, since=2020)
+    db.link(a, knows, c, since=2021)
+    db.link(b, knows, d, since=2022)
+    db.link(c, knows, d, since=2023)
+    return a, b, c, d
+
+
+def test_multi_hop_results_are_unique_nodes():
+    # Diamond graph: d is reachable from a via b and via c. Node results are
+    # unique per node on every execution path (fused, fast, and filtered).
+    user, knows = _build_schema()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "traversal.kitedb")
+        with kite(path, nodes=[user], edges=[knows]) as db:
+            a, b, c, d = _build_diamond(db, user, knows)
+
+            two_hop = db.from_(a).out(knows).out(knows)
+            assert [n.key for n in two_hop.to_list()] == ["user:d"]
+            assert two_hop.ids() == [d.id]
+            assert two_hop.count() == 1
+
+            filtered = (
+                db.from_(a)
+                .out(knows)
+                .out(knows)
+                .where_node(lambda n: True)
+                .to_list()
+            )
+            assert [n.key for n in filtered] == ["user:d"]
+
+            # Edge results keep per-edge multiplicity: two distinct edges
+            # arrive at d.
+            edges = db.from_(a).out(knows).out(knows).edges().to_list()
+            assert len(edges) == 2
+            assert {e.src for e in edges} == {b.id, c.id}
+
+
+def test_where_edge_keeps_multi_path_nodes():
+    # d is reached via two edges; the node must survive as long as any of
+    # its edges passes the filter, regardless of which edge arrives first.
+    user, knows = _build_schema()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "traversal.kitedb")
+        with kite(path, nodes=[user], edges=[knows]) as db:
+            a, b, c, d = _build_diamond(db, user, knows)
+
+            matched = (
+                db.from_(a)
+                .out(knows)
+                .out(knows)
+                .where_edge(lambda e: e.since == 2023)
+                .to_list()
+            )
+            assert [n.key for n in matched] == ["user:d"]
+
+            edges = (
+                db.from_(a)
+                .out(knows)
+                .out(knows)
+                .where_edge(lambda e: e.since == 2023)
+                .edges()
+                .to_list()
+            )
+            assert [(e.src, e.dst) for e in edges] == [(c.id, d.id)]
+
+            none = (
+                db.from_(a)
+                .out(knows)
+                .out(knows)
+                .where_edge(lambda e: e.since == 1999)
+                .to_list()
+            )
+            assert none == []
+
+
+def test_count_fast_paths():
+    user, knows = _build_schema()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "traversal.kitedb")
+        with kite(path, nodes=[user], edges=[knows]) as db:
+            a, b, c, d = _build_diamond(db, user, knows)
+
+            assert db.from_(a).out(knows).count() == 2
+            assert db.from_(a).out(knows).take(1).count() == 1
+            assert db.from_(a).out(knows).out(knows).count() == 1
+
+            # take(0) is empty and agrees across the scalar and list paths.
+            assert db.from_(a).out(knows).take(0).to_list() == []
+            assert db.from_(a).out(knows).take(0).ids() == []
+            assert db.from_(a).out(knows).take(0).count() == 0
+
+            # Structured prop filters on the ref-free count path.
+            assert db.from_(a).out(knows).where_prop("age", "<", 3).count() == 1
+            assert db.from_(a).out(knows).where_prop("age", ">=", 2).count() == 2
+            assert db.from_(a).out(knows).where_prop("age", ">", 100).count() == 0
+            assert (
+                db.from_(a).out(knows).where_prop("age", ">=", 2).take(1).count() == 1
+            )
+
+            # Predicate filters still count through full execution.
+            assert (
+                db.from_(a)
+                .out(knows)
+                .where_node(lambda n: n.age == 2, required_props=["age"])
+                .count()
+                == 1
+            )
+            assert (
+                db.from_(a).out(knows).where_node(lambda n: n.age == 2).count() == 1
+            )
+
+
+def test_where_prop_filters_results():
+    user, knows = _build_schema()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "traversal.kitedb")
+        with kite(path, nodes=[user], edges=[knows]) as db:
+            a, b, c, d = _build_diamond(db, user, knows)
+
+            young = db.from_(a).out(knows).where_prop("age", "<=", 2).to_list()
+            assert [n.key for n in young] == ["user:b"]
+            assert young[0].age == 2
+
+            named = db.from_(a).out(knows).where_prop("name", "==", "C").to_list()
+            assert [n.key for n in named] == ["user:c"]
+
+            chained = (
+                db.from_(a)
+                .out(knows)
+                .where_prop("age", ">", 1)
+                .where_prop("age", "!=", 3)
+                .to_list()
+            )
+            assert [n.key for n in chained] == ["user:b"]
+
+            # Filters compose with multi-hop chains and other scalar getters.
+            assert (
+                db.from_(a).out(knows).out(knows).where_prop("age", "==", 4).ids()
+                == [d.id]
+            )
+            assert db.from_(a).out(knows).where_prop("age", ">", 100).to_list() == []
+
+            with pytest.raises(ValueError, match="Unknown prop filter operator"):
+                db.from_(a).out(knows).where_prop("age", "~=", 2)
+
+
+def test_both_traversal():
+    user, knows = _build_schema()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "traversal.kitedb")
+        with kite(path, nodes=[user], edges=[knows]) as db:
+            a, b, c, d = _build_diamond(db, user, knows)
+
+            # b has one incoming (a) and one outgoing (d) edge.
+            neighbors = db.from_(b).both(knows).to_list()
+            assert {n.key for n in neighbors} == {"user:a", "user:d"}
+            assert db.from_(b).both(knows).count() == 2
+            assert set(db.from_(b).both(knows).ids()) == {a.id, d.id}
+
+
+def test_to_columns():
+    np = pytest.importorskip("numpy")
+    user, knows = _build_schema()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "traversal.kitedb")
+        with kite(path, nodes=[user], edges=[knows]) as db:
+            a, b, c, d = _build_diamond(db, user, knows)
+
+            cols = db.from_(a).out(knows).to_columns()
+            assert cols["id"].dtype == np.int64
+            assert sorted(cols["key"]) == ["user:b", "user:c"]
+            assert cols["age"].dtype == np.int64
+            assert sorted(cols["age"].tolist()) == [2, 3]
+            assert sorted(cols["name"].tolist()) == ["B", "C"]
+
+            # Vectorized predicate over a column.
+            assert cols["id"][cols["age"] < 3].tolist() == [b.id]
+
+            # Structured filters stay on the columnar path.
+            young = db.from_(a).out(knows).where_prop("age", "<", 3).to_columns()
+            assert young["key"] == ["user:b"]
+            assert young["age"].tolist() == [2]
+
+            # Predicate filters fall back to reified nodes but agree.
+            filtered = (
+                db.from_(a).out(knows).where_node(lambda n: n.age == 2).to_columns()
+            )
+            assert filtered["key"] == ["user:b"]
+            assert filtered["age"].tolist() == [2]
+
+            # select() limits which prop columns come back.
+            selected = db.from_(a).out(knows).select(["name"]).to_columns()
+            assert "age" not in selected
+            assert sorted(selected["name"].tolist()) == ["B", "C"]
+
+
+def test_batch_lookup_bindings():
+    user, knows = _build_schema()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "traversal.kitedb")
+        with kite(path, nodes=[user], edges=[knows]) as db:
+            a, b, c, d = _build_diamond(db, user, knows)
+
+            keys = db._db.get_node_keys_batch([a.id, d.id, 999999])
+            assert keys == ["user:a", "user:d", None]
+
+            props = db._db.get_node_props_batch([a.id, 999999])
+            assert props[1] is None
+            assert len(props[0]) == 2
+
+            both = db._db.traverse_both(b.id, knows._etype_id)
+            assert set(both) == {a.id, d.id}
+            with_keys = dict(db._db.traverse_both_with_keys(b.id, knows._etype_id))
+            assert with_keys == {a.id: "user:a", d.id: "user:d"}
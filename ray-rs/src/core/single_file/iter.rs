@@ -401,6 +401,7 @@ impl SingleFileDB {
       snapshot_nodes,
       snapshot_edges,
       snapshot_max_node_id,
+      next_node_id: self.next_node_id.load(std::sync::atomic::Ordering::SeqCst),
       delta_nodes_created: delta.created_nodes.len(),
       delta_nodes_deleted: delta.deleted_nodes.len(),
       delta_edges_added: delta.total_edges_added(),
@@ -501,6 +501,7 @@ pub struct DbStats {
   pub snapshot_nodes: i64,
   pub snapshot_edges: i64,
   pub snapshot_max_node_id: i64,
+  pub next_node_id: i64,
   pub delta_nodes_created: i64,
   pub delta_nodes_deleted: i64,
   pub delta_edges_added: i64,
@@ -3001,6 +3002,7 @@ impl Database {
           snapshot_nodes: s.snapshot_nodes as i64,
           snapshot_edges: s.snapshot_edges as i64,
           snapshot_max_node_id: s.snapshot_max_node_id as i64,
+          next_node_id: s.next_node_id as i64,
           delta_nodes_created: s.delta_nodes_created as i64,
           delta_nodes_deleted: s.delta_nodes_deleted as i64,
           delta_edges_added: s.delta_edges_added as i64,
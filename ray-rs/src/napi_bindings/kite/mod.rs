@@ -802,6 +802,7 @@ impl Kite {
         snapshot_nodes: s.snapshot_nodes as i64,
         snapshot_edges: s.snapshot_edges as i64,
         snapshot_max_node_id: s.snapshot_max_node_id as i64,
+        next_node_id: s.next_node_id as i64,
         delta_nodes_created: s.delta_nodes_created as i64,
         delta_nodes_deleted: s.delta_nodes_deleted as i64,
         delta_edges_added: s.delta_edges_added as i64,
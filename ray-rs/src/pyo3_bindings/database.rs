@@ -579,6 +579,15 @@ impl PyDatabase {
     )
   }
 
+  #[pyo3(name = "get_node_keys_batch")]
+  fn node_keys_batch(&self, node_ids: Vec<i64>) -> PyResult<Vec<Option<String>>> {
+    dispatch_ok!(
+      self,
+      |db| nodes::node_keys_batch_single(db, node_ids.iter().map(|&n| n as NodeId).collect()),
+      |db| nodes::node_keys_batch_single(db, node_ids.iter().map(|&n| n as NodeId).collect())
+    )
+  }
+
   fn list_nodes(&self) -> PyResult<Vec<i64>> {
     dispatch_ok!(self, |db| nodes::list_nodes_single(db), |db| {
       nodes::list_nodes_single(db)
@@ -937,6 +946,21 @@ impl PyDatabase {
     )
   }
 
+  #[pyo3(name = "get_node_props_batch")]
+  fn node_props_batch(&self, node_ids: Vec<i64>) -> PyResult<Vec<Option<Vec<NodeProp>>>> {
+    dispatch_ok!(
+      self,
+      |db| properties::node_props_batch_single(
+        db,
+        node_ids.iter().map(|&n| n as NodeId).collect()
+      ),
+      |db| properties::node_props_batch_single(
+        db,
+        node_ids.iter().map(|&n| n as NodeId).collect()
+      )
+    )
+  }
+
   fn set_edge_prop(
     &self,
     src: i64,
@@ -1305,6 +1329,28 @@ impl PyDatabase {
     )
   }
 
+  #[pyo3(signature = (node_id, etype=None))]
+  fn traverse_both(&self, node_id: i64, etype: Option<u32>) -> PyResult<Vec<i64>> {
+    dispatch_ok!(
+      self,
+      |db| graph_traversal::traverse_both_single(db, node_id as NodeId, etype),
+      |db| graph_traversal::traverse_both_single(db, node_id as NodeId, etype)
+    )
+  }
+
+  #[pyo3(signature = (node_id, etype=None))]
+  fn traverse_both_with_keys(
+    &self,
+    node_id: i64,
+    etype: Option<u32>,
+  ) -> PyResult<Vec<(i64, Option<String>)>> {
+    dispatch_ok!(
+      self,
+      |db| graph_traversal::traverse_both_with_keys_single(db, node_id as NodeId, etype),
+      |db| graph_traversal::traverse_both_with_keys_single(db, node_id as NodeId, etype)
+    )
+  }
+
   fn traverse_multi(
     &self,
     start_ids: Vec<i64>,
@@ -2526,6 +2572,7 @@ pub fn restore_backup(
 }
 
 #[pyfunction]
+#[pyo3(name = "get_backup_info")]
 pub fn backup_info(backup_path: String) -> PyResult<BackupResult> {
   core_backup::backup_info(backup_path)
     .map(BackupResult::from)
@@ -137,6 +137,45 @@ pub fn traverse_in_count_single(
   }
 }
 
+pub fn traverse_both_single(
+  db: &RustSingleFileDB,
+  node_id: NodeId,
+  etype: Option<ETypeId>,
+) -> Vec<i64> {
+  let mut seen: HashSet<NodeId> = HashSet::new();
+  let mut result: Vec<i64> = Vec::new();
+  for (e, neighbor) in db
+    .out_edges(node_id)
+    .into_iter()
+    .chain(db.in_edges(node_id))
+  {
+    if (etype.is_none() || etype == Some(e)) && seen.insert(neighbor) {
+      result.push(neighbor as i64);
+    }
+  }
+  result
+}
+
+pub fn traverse_both_with_keys_single(
+  db: &RustSingleFileDB,
+  node_id: NodeId,
+  etype: Option<ETypeId>,
+) -> Vec<(i64, Option<String>)> {
+  let mut seen: HashSet<NodeId> = HashSet::new();
+  let mut result: Vec<(i64, Option<String>)> = Vec::new();
+  for (e, neighbor) in db
+    .out_edges(node_id)
+    .into_iter()
+    .chain(db.in_edges(node_id))
+  {
+    if (etype.is_none() || etype == Some(e)) && seen.insert(neighbor) {
+      let key = db.node_key(neighbor);
+      result.push((neighbor as i64, key));
+    }
+  }
+  result
+}
+
 pub fn traverse_multi_single(
   db: &RustSingleFileDB,
   start_ids: Vec<i64>,
@@ -63,6 +63,14 @@ pub fn node_key_single(db: &RustSingleFileDB, node_id: NodeId) -> Option<String>
   db.node_key(node_id)
 }
 
+/// Get node keys for many nodes in one call on single-file database
+pub fn node_keys_batch_single(db: &RustSingleFileDB, node_ids: Vec<NodeId>) -> Vec<Option<String>> {
+  node_ids
+    .into_iter()
+    .map(|node_id| db.node_key(node_id))
+    .collect()
+}
+
 /// List nodes on single-file database
 pub fn list_nodes_single(db: &RustSingleFileDB) -> Vec<i64> {
   db.list_nodes().into_iter().map(|id| id as i64).collect()
@@ -106,6 +106,17 @@ pub fn node_props_single(db: &RustSingleFileDB, node_id: NodeId) -> Option<Vec<N
   })
 }
 
+/// Get all node properties for many nodes in one call on single-file database
+pub fn node_props_batch_single(
+  db: &RustSingleFileDB,
+  node_ids: Vec<NodeId>,
+) -> Vec<Option<Vec<NodeProp>>> {
+  node_ids
+    .into_iter()
+    .map(|node_id| node_props_single(db, node_id))
+    .collect()
+}
+
 // ============================================================================
 // Single-file database edge property operations
 // ============================================================================
@@ -17,6 +17,8 @@ pub struct DbStats {
   #[pyo3(get)]
   pub snapshot_max_node_id: i64,
   #[pyo3(get)]
+  pub next_node_id: i64,
+  #[pyo3(get)]
   pub delta_nodes_created: i64,
   #[pyo3(get)]
   pub delta_nodes_deleted: i64,
@@ -190,6 +192,7 @@ mod tests {
       snapshot_nodes: 100,
       snapshot_edges: 200,
       snapshot_max_node_id: 100,
+      next_node_id: 101,
       delta_nodes_created: 10,
       delta_nodes_deleted: 5,
       delta_edges_added: 20,
@@ -530,6 +530,9 @@ pub struct DbStats {
   pub snapshot_nodes: u64,
   pub snapshot_edges: u64,
   pub snapshot_max_node_id: u64,
+  /// Next node id the allocator would hand out; exclusive upper bound on all
+  /// existing node ids (including ones created via create_node_with_id).
+  pub next_node_id: u64,
   pub delta_nodes_created: usize,
   pub delta_nodes_deleted: usize,
   pub delta_edges_added: usize,